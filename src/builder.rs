@@ -3,7 +3,7 @@
 use std::{
     borrow::Cow,
     fs::{read_dir, File},
-    io::{read_to_string, Write},
+    io::{read_to_string, Seek, Write},
     iter::{once, repeat},
     path::PathBuf,
 };
@@ -402,6 +402,7 @@ impl<'b> Builder<'b> {
 }
 
 const SPACE: char = ' ';
+const DOUBLE_SPACE: &str = "  ";
 const NEW_LINE: char = '\n';
 const DOUBLE_NEW_LINE: &str = "\n\n";
 const NO_SIGNIFICANT_CHANGES: &str = "No significant changes.";
@@ -414,7 +415,12 @@ fn heading(character: char, level: Level) -> String {
 }
 
 fn indent(character: char) -> String {
-    once(character).chain(once(SPACE)).collect()
+    let mut string = String::with_capacity(character.len_utf8() + SPACE.len_utf8());
+
+    string.push(character);
+    string.push(SPACE);
+
+    string
 }
 
 impl Builder<'_> {
@@ -440,24 +446,22 @@ impl Builder<'_> {
 
         let path = self.config.paths.output.as_ref();
 
-        let file = File::options()
+        let mut file = File::options()
             .read(true)
+            .write(true)
             .open(path)
             .map_err(|error| WriteError::new_open_file(error, path.to_owned()))?;
 
-        let contents = read_to_string(file)
+        let contents = read_to_string(&mut file)
             .map_err(|error| WriteError::new_read_file(error, path.to_owned()))?;
 
-        let mut file = File::options()
-            .create(true)
-            .write(true)
-            .truncate(true)
-            .open(path)
-            .map_err(|error| WriteError::new_open_file(error, path.to_owned()))?;
-
         let start = self.config.start.as_ref();
 
-        let mut string = String::new();
+        // the output never exceeds the contents, the entry and the separators combined
+
+        let mut string = String::with_capacity(
+            contents.len() + entry.len() + DOUBLE_NEW_LINE.len() + 2 * NEW_LINE.len_utf8(),
+        );
 
         if let Some((before, after)) = contents.split_once(start) {
             string.push_str(before);
@@ -491,7 +495,9 @@ impl Builder<'_> {
             }
         };
 
-        write!(file, "{string}")
+        file.set_len(0)
+            .and_then(|()| file.rewind())
+            .and_then(|()| file.write_all(string.as_bytes()))
             .map_err(|error| WriteError::new_write_file(error, path.to_owned()))?;
 
         Ok(())
@@ -574,9 +580,19 @@ impl Builder<'_> {
     ///
     /// Returns [`BuildFragmentError`] when rendering fails.
     pub fn build_fragment(&self, fragment: &Fragment<'_>) -> Result<String, BuildFragmentError> {
+        let initial_indent = indent(self.config.indents.bullet);
+
+        self.build_fragment_with(fragment, &self.wrap_options(&initial_indent))
+    }
+
+    fn build_fragment_with(
+        &self,
+        fragment: &Fragment<'_>,
+        options: &WrapOptions<'_>,
+    ) -> Result<String, BuildFragmentError> {
         let string = self.render_fragment(fragment)?;
 
-        Ok(self.wrap(string))
+        Ok(fill(&string, options))
     }
 
     /// Builds multiple fragments and joins them together.
@@ -585,12 +601,18 @@ impl Builder<'_> {
     ///
     /// Returns [`BuildFragmentError`] when building any of the fragments fails.
     pub fn build_fragments(&self, fragments: &Fragments<'_>) -> Result<String, BuildFragmentError> {
-        let string = fragments
+        // the initial indent is the same for every fragment, so it is constructed once
+
+        let initial_indent = indent(self.config.indents.bullet);
+
+        let options = self.wrap_options(&initial_indent);
+
+        let built: Vec<_> = fragments
             .iter()
-            .map(|fragment| self.build_fragment(fragment))
-            .process_results(|iterator| iterator.into_iter().join(DOUBLE_NEW_LINE))?;
+            .map(|fragment| self.build_fragment_with(fragment, &options))
+            .collect::<Result<_, _>>()?;
 
-        Ok(string)
+        Ok(built.join(DOUBLE_NEW_LINE))
     }
 
     /// Builds sections.
@@ -642,15 +664,21 @@ impl Builder<'_> {
     pub fn build_sections(&self, sections: &Sections<'_>) -> Result<String, BuildFragmentError> {
         let types = self.config.types_with_defaults();
 
-        let string = self
+        let built: Vec<_> = self
             .config
             .order
             .iter()
-            .filter_map(|name| types.get(name).zip(sections.get(name)))
+            .filter_map(|name| {
+                let fragments = sections.get(name)?;
+
+                let title = types.get(name)?;
+
+                Some((title, fragments))
+            })
             .map(|(title, fragments)| self.build_section(title, fragments))
-            .process_results(|iterator| iterator.into_iter().join(DOUBLE_NEW_LINE))?;
+            .collect::<Result<_, _>>()?;
 
-        Ok(string)
+        Ok(built.join(DOUBLE_NEW_LINE))
     }
 
     // WRAPPING
@@ -658,16 +686,17 @@ impl Builder<'_> {
     /// Wraps the given string.
     pub fn wrap_str(&self, string: &str) -> String {
         let initial_indent = indent(self.config.indents.bullet);
-        let subsequent_indent = indent(SPACE);
 
-        let options = WrapOptions::new(self.config.wrap.get())
+        fill(string, self.wrap_options(&initial_indent))
+    }
+
+    fn wrap_options<'o>(&self, initial_indent: &'o str) -> WrapOptions<'o> {
+        WrapOptions::new(self.config.wrap.get())
             .break_words(false)
             .word_separator(WordSeparator::AsciiSpace)
             .word_splitter(WordSplitter::NoHyphenation)
-            .initial_indent(&initial_indent)
-            .subsequent_indent(&subsequent_indent);
-
-        fill(string, options)
+            .initial_indent(initial_indent)
+            .subsequent_indent(DOUBLE_SPACE)
     }
 
     /// Similar to [`wrap_str`], except the input is [`AsRef<str>`].
@@ -729,14 +758,19 @@ impl Builder<'_> {
                     .into_iter()
                     .filter_map(|path| load::<Fragment<'_>, _>(path).ok()) // ignore errors
                     .for_each(|fragment| {
-                        sections
-                            .entry(fragment.partial.type_name.clone())
-                            .or_default()
-                            .push(fragment);
+                        // only clone the type name when inserting new sections
+
+                        if let Some(section) = sections.get_mut(&fragment.partial.type_name) {
+                            section.push(fragment);
+                        } else {
+                            sections.insert(fragment.partial.type_name.clone(), vec![fragment]);
+                        }
                     });
             })?;
 
-        sections.values_mut().for_each(|section| section.sort());
+        sections
+            .values_mut()
+            .for_each(|section| section.sort_unstable());
 
         Ok(sections)
     }
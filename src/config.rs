@@ -197,7 +197,7 @@ pub const DEFAULT_ENTRY: Level = Level::new(2).unwrap();
 pub const DEFAULT_SECTION: Level = Level::new(3).unwrap();
 
 /// Defines which heading levels to use.
-#[derive(Debug, Clone, PartialEq, Eq, Serialize, Deserialize)]
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Hash, Serialize, Deserialize)]
 #[serde(default)]
 pub struct Levels {
     /// The heading level of the entry title.
@@ -206,17 +206,20 @@ pub struct Levels {
     pub section: Level,
 }
 
+/// The default `levels` value.
+pub const DEFAULT_LEVELS: Levels = Levels {
+    entry: DEFAULT_ENTRY,
+    section: DEFAULT_SECTION,
+};
+
 impl Default for Levels {
     fn default() -> Self {
-        let entry = DEFAULT_ENTRY;
-        let section = DEFAULT_SECTION;
-
-        Self { entry, section }
+        DEFAULT_LEVELS
     }
 }
 
 /// Specifies characters to use for headings and indentation.
-#[derive(Debug, Clone, PartialEq, Eq, Serialize, Deserialize)]
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Hash, Serialize, Deserialize)]
 #[serde(default)]
 pub struct Indents {
     /// The character to use for headings.
@@ -231,12 +234,15 @@ pub const DEFAULT_HEADING: char = '#';
 /// The default `indents.bullet` value.
 pub const DEFAULT_BULLET: char = '-';
 
+/// The default `indents` value.
+pub const DEFAULT_INDENTS: Indents = Indents {
+    heading: DEFAULT_HEADING,
+    bullet: DEFAULT_BULLET,
+};
+
 impl Default for Indents {
     fn default() -> Self {
-        let heading = DEFAULT_HEADING;
-        let bullet = DEFAULT_BULLET;
-
-        Self { heading, bullet }
+        DEFAULT_INDENTS
     }
 }
 
@@ -256,12 +262,15 @@ pub const DEFAULT_TITLE: &str = "{{version}} ({{date}})";
 /// The default `formats.fragment` value.
 pub const DEFAULT_FRAGMENT: &str = "{{content}} (#{{id}})";
 
+/// The default `formats` value.
+pub const DEFAULT_FORMATS: Formats<'static> = Formats {
+    title: Cow::Borrowed(DEFAULT_TITLE),
+    fragment: Cow::Borrowed(DEFAULT_FRAGMENT),
+};
+
 impl Default for Formats<'_> {
     fn default() -> Self {
-        let title = Cow::Borrowed(DEFAULT_TITLE);
-        let fragment = Cow::Borrowed(DEFAULT_FRAGMENT);
-
-        Self { title, fragment }
+        DEFAULT_FORMATS
     }
 }
 
@@ -274,73 +283,94 @@ pub const DEFAULT_WRAP: Wrap = Wrap::new(100).unwrap();
 /// Defines which types to include, and in what order to do so.
 pub type Order<'o> = Vec<Cow<'o, str>>;
 
+/// The default `order` entries.
+pub const DEFAULT_ORDER: [&str; 7] = [
+    "security",
+    "feature",
+    "change",
+    "fix",
+    "deprecation",
+    "removal",
+    "internal",
+];
+
 /// Returns the default `order` value.
 pub fn default_order() -> Vec<&'static str> {
-    vec![
-        "security",
-        "feature",
-        "change",
-        "fix",
-        "deprecation",
-        "removal",
-        "internal",
-    ]
+    DEFAULT_ORDER.to_vec()
 }
 
-fn into_order(vec: Vec<&str>) -> Order<'_> {
-    vec.into_iter().map(Cow::Borrowed).collect()
+fn into_order<'o, I: IntoIterator<Item = &'o str>>(iterator: I) -> Order<'o> {
+    iterator.into_iter().map(Cow::Borrowed).collect()
 }
 
 /// Specifies the mapping of types to their titles.
 pub type Types<'t> = HashMap<Cow<'t, str>, Cow<'t, str>>;
 
 /// Represents configurations.
+///
+/// Defaults are constructed per field, only for fields absent during deserialization.
 #[derive(Debug, Clone, PartialEq, Eq, Serialize, Deserialize)]
-#[serde(default)]
 pub struct Config<'c> {
     /// The `paths` section.
+    #[serde(default)]
     pub paths: Paths<'c>,
     /// The `start` field.
+    #[serde(default = "default_start")]
     pub start: Start<'c>,
     /// The `levels` section.
+    #[serde(default)]
     pub levels: Levels,
     /// The `indents` section.
+    #[serde(default)]
     pub indents: Indents,
     /// The `formats` section.
+    #[serde(default)]
     pub formats: Formats<'c>,
     /// The `wrap` field.
+    #[serde(default = "default_wrap")]
     pub wrap: Wrap,
     /// The `order` field.
+    #[serde(default = "into_default_order")]
     pub order: Order<'c>,
     /// The `types` section.
+    #[serde(default = "into_default_types")]
     pub types: Types<'c>,
 }
 
-macro_rules! hash_map {
-    ($($key: expr => $value: expr),* $(,)?) => {
-        ::std::collections::HashMap::from([
-            $(
-                ($key, $value),
-            )*
-        ])
-    }
+fn default_start() -> Start<'static> {
+    Cow::Borrowed(DEFAULT_START)
 }
 
+fn default_wrap() -> Wrap {
+    DEFAULT_WRAP
+}
+
+fn into_default_order() -> Order<'static> {
+    into_order(DEFAULT_ORDER)
+}
+
+fn into_default_types() -> Types<'static> {
+    into_types(DEFAULT_TYPES)
+}
+
+/// The default `types` entries.
+pub const DEFAULT_TYPES: [(&str, &str); 7] = [
+    ("security", "Security"),
+    ("feature", "Features"),
+    ("change", "Changes"),
+    ("fix", "Fixes"),
+    ("deprecation", "Deprecations"),
+    ("removal", "Removals"),
+    ("internal", "Internal"),
+];
+
 /// Returns the default `types` value.
 pub fn default_types() -> HashMap<&'static str, &'static str> {
-    hash_map! {
-        "security" => "Security",
-        "feature" => "Features",
-        "change" => "Changes",
-        "fix" => "Fixes",
-        "deprecation" => "Deprecations",
-        "removal" => "Removals",
-        "internal" => "Internal",
-    }
+    HashMap::from(DEFAULT_TYPES)
 }
 
-fn into_types<'t>(hash_map: HashMap<&'t str, &'t str>) -> Types<'t> {
-    hash_map
+fn into_types<'t, I: IntoIterator<Item = (&'t str, &'t str)>>(iterator: I) -> Types<'t> {
+    iterator
         .into_iter()
         .map(|(name, title)| (Cow::Borrowed(name), Cow::Borrowed(title)))
         .collect()
@@ -350,7 +380,7 @@ impl Default for Config<'_> {
     fn default() -> Self {
         let paths = Paths::default();
 
-        let start = Cow::Borrowed(DEFAULT_START);
+        let start = default_start();
 
         let levels = Levels::default();
 
@@ -358,11 +388,11 @@ impl Default for Config<'_> {
 
         let formats = Formats::default();
 
-        let wrap = DEFAULT_WRAP;
+        let wrap = default_wrap();
 
-        let order = into_order(default_order());
+        let order = into_default_order();
 
-        let types = into_types(default_types());
+        let types = into_default_types();
 
         Self {
             paths,
@@ -409,13 +439,20 @@ impl Config<'_> {
     }
 }
 
-impl Config<'_> {
+impl<'c> Config<'c> {
     /// Returns `types` with defaults included.
-    pub fn types_with_defaults(&self) -> Types<'_> {
-        let mut types_with_defaults = into_types(default_types());
+    pub fn types_with_defaults(&self) -> Types<'c> {
+        // configured types come after the defaults, therefore overriding them
+
+        let defaults = DEFAULT_TYPES
+            .into_iter()
+            .map(|(name, title)| (Cow::Borrowed(name), Cow::Borrowed(title)));
 
-        types_with_defaults.extend(self.types.clone());
+        let configured = self
+            .types
+            .iter()
+            .map(|(name, title)| (name.clone(), title.clone()));
 
-        types_with_defaults
+        defaults.chain(configured).collect()
     }
 }
@@ -20,6 +20,8 @@ use crate::{
 pub struct CurrentDirectoryError(#[from] pub std::io::Error);
 
 /// Represents errors that can occur when checking the existence of paths fails.
+///
+/// Note that [`discover`] no longer checks existence separately, so it does not return this error.
 #[derive(Debug, Error, Diagnostic)]
 #[error("failed to check existence of `{path}`")]
 #[diagnostic(
@@ -147,8 +149,8 @@ pub const PYPROJECT: &str = "pyproject.toml";
 ///
 /// # Errors
 ///
-/// Returns [`struct@Error`] if fetching the current directory, checking the existence
-/// or loading the workspace fails. Also returned when no workspace can be found.
+/// Returns [`struct@Error`] if fetching the current directory or loading the workspace fails.
+/// Also returned when no workspace can be found.
 pub fn discover() -> Result<Workspace<'static>, Error> {
     let mut path = current_dir().map_err(Error::new_current_directory)?;
 
@@ -156,11 +158,10 @@ pub fn discover() -> Result<Workspace<'static>, Error> {
 
     path.push(CHANGELOGGING);
 
-    if path
-        .try_exists()
-        .map_err(|error| Error::new_existence(error, path.clone()))?
-    {
-        return load(path.as_path()).map_err(Error::workspace);
+    match load(path.as_path()) {
+        Ok(workspace) => return Ok(workspace),
+        Err(error) if !error.is_not_found() => return Err(Error::workspace(error)),
+        Err(_) => {}
     }
 
     // try `pyproject.toml` if it contains `tool.changelogging`
@@ -169,15 +170,14 @@ pub fn discover() -> Result<Workspace<'static>, Error> {
 
     path.push(PYPROJECT);
 
-    if path
-        .try_exists()
-        .map_err(|error| Error::new_existence(error, path.clone()))?
-    {
-        let pyproject: PyProject<'_> = load(path.as_path()).map_err(Error::workspace)?;
-
-        if let Some(workspace) = pyproject.into_workspace() {
-            return Ok(workspace);
+    match load::<PyProject<'_>, _>(path.as_path()) {
+        Ok(pyproject) => {
+            if let Some(workspace) = pyproject.into_workspace() {
+                return Ok(workspace);
+            }
         }
+        Err(error) if !error.is_not_found() => return Err(Error::workspace(error)),
+        Err(_) => {}
     }
 
     // not found
@@ -18,7 +18,7 @@ use crate::load::Load;
 pub type Integer = u32;
 
 /// Represents fragment IDs.
-#[derive(Debug, Clone, PartialEq, Eq, PartialOrd, Ord, Serialize, Deserialize)]
+#[derive(Debug, Clone, PartialEq, Eq, PartialOrd, Ord, Hash, Serialize, Deserialize)]
 #[serde(untagged)]
 pub enum Id<'i> {
     /// Integer fragment ID.
@@ -29,7 +29,7 @@ pub enum Id<'i> {
 
 impl<'i> Id<'i> {
     /// Constructs [`Self`] from [`Integer`].
-    pub fn integer(value: Integer) -> Self {
+    pub const fn integer(value: Integer) -> Self {
         Self::Integer(value)
     }
 
@@ -39,38 +39,59 @@ impl<'i> Id<'i> {
     }
 
     /// Constructs [`Self`] from [`str`].
-    pub fn borrowed(string: &'i str) -> Self {
+    pub const fn borrowed(string: &'i str) -> Self {
         Self::String(Cow::Borrowed(string))
     }
 }
 
 impl Id<'_> {
     /// Checks if [`Self`] is [`Integer`].
-    pub fn is_integer(&self) -> bool {
+    pub const fn is_integer(&self) -> bool {
         matches!(self, Self::Integer(_))
     }
 
     /// Checks if [`Self`] is [`String`].
-    pub fn is_string(&self) -> bool {
+    pub const fn is_string(&self) -> bool {
         matches!(self, Self::String(_))
     }
 }
 
-impl FromStr for Id<'_> {
-    type Err = InvalidIdError;
-
-    fn from_str(string: &str) -> Result<Self, Self::Err> {
+impl<'i> Id<'i> {
+    /// Parses [`Self`] from the given string, borrowing string IDs from it.
+    ///
+    /// # Errors
+    ///
+    /// Returns [`InvalidIdError`] if `string` is invalid.
+    pub fn parse_borrowed(string: &'i str) -> Result<Self, InvalidIdError> {
         if let Some(stripped) = string.strip_prefix(STRING_PREFIX) {
-            Ok(Self::owned(stripped.to_owned()))
+            Ok(Self::borrowed(stripped))
         } else {
             string
                 .parse()
                 .map(Self::integer)
-                .map_err(|_| Self::Err::new(string.to_owned()))
+                .map_err(|_| InvalidIdError::new(string.to_owned()))
+        }
+    }
+}
+
+impl Id<'_> {
+    /// Converts [`Self`] into the owned version.
+    pub fn into_owned(self) -> Id<'static> {
+        match self {
+            Self::Integer(value) => Id::integer(value),
+            Self::String(string) => Id::owned(string.into_owned()),
         }
     }
 }
 
+impl FromStr for Id<'_> {
+    type Err = InvalidIdError;
+
+    fn from_str(string: &str) -> Result<Self, Self::Err> {
+        Id::parse_borrowed(string).map(Id::into_owned)
+    }
+}
+
 /// Represents errors that can occur when parsing fragment IDs.
 #[derive(Debug, Error, Diagnostic)]
 #[error("failed to parse `{string}` into fragment ID")]
@@ -157,7 +178,7 @@ impl ParseError {
 }
 
 /// Represents partial fragments.
-#[derive(Debug, Clone, PartialEq, Eq, PartialOrd, Ord, Serialize, Deserialize)]
+#[derive(Debug, Clone, PartialEq, Eq, PartialOrd, Ord, Hash, Serialize, Deserialize)]
 pub struct Partial<'p> {
     /// The ID of the fragment.
     pub id: Id<'p>,
@@ -174,36 +195,57 @@ impl<'p> Partial<'p> {
 
 const DOT: char = '.';
 
-impl FromStr for Partial<'_> {
-    type Err = ParseError;
-
-    fn from_str(name: &str) -> Result<Self, Self::Err> {
+impl<'p> Partial<'p> {
+    /// Parses [`Self`] from the given name, borrowing from it.
+    ///
+    /// # Errors
+    ///
+    /// Returns [`ParseError`] if `name` is invalid.
+    pub fn parse_borrowed(name: &'p str) -> Result<Self, ParseError> {
         let mut split = name.split(DOT);
 
         let id = split
             .next()
-            .ok_or_else(|| ParseError::new_unexpected_eof(name.to_owned()))?
-            .parse()
+            .ok_or_else(|| ParseError::new_unexpected_eof(name.to_owned()))
+            .map(Id::parse_borrowed)?
             .map_err(|error| ParseError::invalid_id(error, name.to_owned()))?;
 
         let type_name = split
             .next()
-            .ok_or_else(|| ParseError::new_unexpected_eof(name.to_owned()))?
-            .to_owned();
+            .ok_or_else(|| ParseError::new_unexpected_eof(name.to_owned()))?;
 
-        Ok(Self::new(id, Cow::Owned(type_name)))
+        Ok(Self::new(id, Cow::Borrowed(type_name)))
+    }
+}
+
+impl Partial<'_> {
+    /// Converts [`Self`] into the owned version.
+    pub fn into_owned(self) -> Partial<'static> {
+        Partial::new(
+            self.id.into_owned(),
+            Cow::Owned(self.type_name.into_owned()),
+        )
+    }
+}
+
+impl FromStr for Partial<'_> {
+    type Err = ParseError;
+
+    fn from_str(name: &str) -> Result<Self, Self::Err> {
+        Partial::parse_borrowed(name).map(Partial::into_owned)
     }
 }
 
 /// Validates that the `string` represents some partial fragment.
 ///
-/// This function parses the string provided, discarding the resulting partial fragment.
+/// This function parses the string provided without allocating,
+/// discarding the resulting partial fragment.
 ///
 /// # Errors
 ///
 /// Returns [`ParseError`] if `string` is invalid.
 pub fn validate_str(string: &str) -> Result<(), ParseError> {
-    let _: Partial<'_> = string.parse()?;
+    Partial::parse_borrowed(string)?;
 
     Ok(())
 }
@@ -219,9 +261,7 @@ pub fn validate<S: AsRef<str>>(string: S) -> Result<(), ParseError> {
 
 /// Checks if the [`path_name`] of the given path represents some partial fragment.
 pub fn is_valid_path_ref(path: &Path) -> bool {
-    path_name(path)
-        .filter(|name| validate_str(name).is_ok())
-        .is_some()
+    path_name(path).is_some_and(|name| validate_str(name).is_ok())
 }
 
 /// Similar to [`is_valid_path_ref`], except the input is [`AsRef<Path>`].
@@ -316,7 +356,7 @@ impl Error {
 }
 
 /// Represents fragments.
-#[derive(Debug, Clone, PartialEq, Eq, PartialOrd, Ord, Serialize, Deserialize)]
+#[derive(Debug, Clone, PartialEq, Eq, PartialOrd, Ord, Hash, Serialize, Deserialize)]
 pub struct Fragment<'f> {
     /// The partial fragment.
     ///
@@ -344,6 +384,16 @@ impl<'f> Fragment<'f> {
     }
 }
 
+fn trim_in_place(string: &mut String) {
+    let end = string.trim_end().len();
+
+    string.truncate(end);
+
+    let start = end - string.trim_start().len();
+
+    string.drain(..start);
+}
+
 impl Load for Fragment<'_> {
     type Error = Error;
 
@@ -356,10 +406,10 @@ impl Load for Fragment<'_> {
             .parse()
             .map_err(|error| Self::Error::parse(error, path.to_owned()))?;
 
-        let content = read_to_string(path)
-            .map_err(|error| Self::Error::new_read(error, path.to_owned()))?
-            .trim()
-            .to_owned();
+        let mut content =
+            read_to_string(path).map_err(|error| Self::Error::new_read(error, path.to_owned()))?;
+
+        trim_in_place(&mut content);
 
         Ok(Self::new(info, Cow::Owned(content)))
     }
@@ -9,6 +9,7 @@
 
 use std::{
     fs::read_to_string,
+    io::ErrorKind,
     path::{Path, PathBuf},
 };
 
@@ -88,6 +89,14 @@ impl Error {
     pub fn new_parse(error: toml::de::Error, path: PathBuf) -> Self {
         Self::parse(ParseError(error), path)
     }
+
+    /// Checks whether [`Self`] is caused by the file not being found.
+    pub fn is_not_found(&self) -> bool {
+        matches!(
+            &self.source,
+            ErrorSource::Read(ReadError(error)) if error.kind() == ErrorKind::NotFound
+        )
+    }
 }
 
 /// Combines [`Context`] and [`Config`] into one structure.